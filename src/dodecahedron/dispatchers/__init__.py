@@ -1,15 +1,11 @@
 # -*- coding: utf-8 -*-
 
 # Standard Library Imports
-import importlib
+from importlib.util import find_spec
 
 # Local Imports
 from .abstract_dispatcher import *
 from .base_dispatcher import *
 
-try:
-    importlib.import_module("tqdm")
-except (ImportError, ModuleNotFoundError):
-    pass
-else:
+if find_spec("tqdm") is not None:
     from .progressive_dispatcher import *
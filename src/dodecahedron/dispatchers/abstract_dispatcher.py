@@ -13,6 +13,8 @@ __all__ = ["AbstractDispatcher"]
 class AbstractDispatcher(abc.ABC):
     """Represents an abstract dispatcherr."""
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def messagebus(self) -> AbstractMessageBus:
@@ -7,6 +7,7 @@ from types import FunctionType
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import FrozenSet
 from typing import List
 from typing import Type
 from typing import Union
@@ -37,10 +38,13 @@ def inject_handler_dependencies(
         Handlers.
 
     """
-    if all(isinstance(item, FunctionType) for item in handlers.values()):
+    # Handlers are either all command handlers or all event handlers, so
+    # only the first value needs to be inspected.
+    first = next(iter(handlers.values()), None)
+    if first is None or isinstance(first, FunctionType):
         results = inject_command_handler_dependencies(handlers, dependencies)
 
-    elif all(isinstance(item, list) for item in handlers.values()):
+    elif isinstance(first, list):
         results = inject_event_handler_dependencies(handlers, dependencies)
 
     else:
@@ -131,17 +135,66 @@ def inject_dependencies(
         handler: Handler function.
         dependencies: Dependencies.
 
+    Returns:
+        Handler function.
+
     .. _Architecture Patterns in Python:
         https://github.com/cosmicpython/code
 
     """
-    params = inspect.signature(handler).parameters
+    params = get_parameter_names(handler)
     kwargs = {
         name: dependency
         for name, dependency in dependencies.items()
         if name in params
     }
-    result = functools.partial(handler, **kwargs)
+    if not kwargs:
+        return handler
+
+    @functools.wraps(handler)
+    def wrapper(*args: Any, **kwds: Any) -> None:
+        """Call handler with injected dependencies.
+
+        Args:
+            *args (optional): Positional arguments.
+            **kwds (optional): Keyword arguments.
+
+        """
+        return handler(*args, **{**kwargs, **kwds})
+
+    # Advertise only the parameters which remain to be supplied, so that the
+    # wrapper is not mistaken for a handler still awaiting its dependencies.
+    signature = inspect.signature(handler)
+    setattr(
+        wrapper,
+        "__signature__",
+        signature.replace(
+            parameters=[
+                param
+                for name, param in signature.parameters.items()
+                if name not in kwargs
+            ]
+        ),
+    )
+    return wrapper
+
+
+@functools.lru_cache(maxsize=256)
+def get_parameter_names(__func: Callable, /) -> FrozenSet[str]:
+    """Get names of parameters accepted by function.
+
+    Results are cached since signature introspection is slow and handlers
+    are injected with dependencies repeatedly. The cache is bounded, as it
+    holds references to the functions introspected.
+
+    Args:
+        __func: Function.
+
+    Returns:
+        Parameter names.
+
+    """
+    result = frozenset(inspect.signature(__func).parameters)
     return result
 
 
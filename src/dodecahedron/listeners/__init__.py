@@ -1,14 +1,10 @@
 # -*- coding: utf-8 -*-
 
 # Standard Library Imports
-import importlib
+from importlib.util import find_spec
 
 # Local Imports
 from .abstract_listener import *
 
-try:
-    importlib.import_module("redis")
-except (ImportError, ModuleNotFoundError):
-    pass
-else:
+if find_spec("redis") is not None:
     from .redis_listener import *
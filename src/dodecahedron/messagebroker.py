@@ -7,10 +7,12 @@ import abc
 from collections import defaultdict
 from datetime import datetime
 import logging
+import time
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Tuple
 
 # Local Imports
 from .metaclasses import SingletonMeta
@@ -21,6 +23,9 @@ __all__ = ["BaseMessageBroker"]
 # Initialize logger.
 log = logging.getLogger("dodecahedron")
 
+# Most recent timestamp, keyed by the millisecond in which it was made.
+timestamp_cache = (0, datetime.fromtimestamp(0))  # type: Tuple[int, datetime]
+
 
 class AbstractMessageBroker(abc.ABC):
     """Represents an abstract message broker."""
@@ -102,7 +107,7 @@ class BaseMessageBroker(AbstractMessageBroker, metaclass=SingletonMeta):
             Message.
 
         """
-        message = {"data": event, "created_at": datetime.now()}
+        message = {"data": event, "created_at": get_timestamp()}
         return message
 
     def send_message(
@@ -115,12 +120,15 @@ class BaseMessageBroker(AbstractMessageBroker, metaclass=SingletonMeta):
             message: Message to send to subscribers.
 
         """
-        for subscriber in self.subscribers[channel]:
+        debug = log.isEnabledFor(logging.DEBUG)
+        subscribers = self.subscribers.get(channel, ())
+        for subscriber in subscribers:
             try:
-                log.debug(
-                    "sending %(event)s event to subscriber %(subscriber)s",
-                    {"event": channel, "subscriber": subscriber},
-                )
+                if debug:
+                    log.debug(
+                        "sending %(event)s event to subscriber %(subscriber)s",
+                        {"event": channel, "subscriber": subscriber},
+                    )
                 subscriber(message)
             except Exception:
                 log.exception("Exception handling %s event", channel)
@@ -135,3 +143,25 @@ class BaseMessageBroker(AbstractMessageBroker, metaclass=SingletonMeta):
 
         """
         self.subscribers[channel].append(subscriber)
+
+
+# ----------------------------------------------------------------------------
+# Helper Functions
+# ----------------------------------------------------------------------------
+def get_timestamp() -> datetime:
+    """Get current timestamp with millisecond precision.
+
+    Messages published within the same millisecond share a single datetime
+    object rather than constructing a new one for each message.
+
+    Returns:
+        Timestamp.
+
+    """
+    global timestamp_cache  # pylint: disable=global-statement
+
+    millis = int(time.time() * 1000)
+    if millis != timestamp_cache[0]:
+        timestamp_cache = (millis, datetime.fromtimestamp(millis / 1000))
+
+    return timestamp_cache[1]
@@ -28,7 +28,6 @@ Implementation based on 'Architecture Patterns in Python' message-bus pattern.
 from __future__ import annotations
 import abc
 import logging
-from operator import methodcaller
 from typing import Callable
 from typing import Dict
 from typing import List
@@ -48,9 +47,6 @@ __all__ = ["BaseMessageBus"]
 # Initialize logger.
 log = logging.getLogger("dodecahedron")
 
-# Constants
-eventcollector = methodcaller("collect_events")
-
 
 class AbstractMessageBus(abc.ABC):
     """Represents an abstract message bus.
@@ -112,6 +108,8 @@ class BaseMessageBus(AbstractMessageBus):
         self.uow = uow
         self.command_handlers = command_handlers
         self.event_handlers = event_handlers
+        self._collect_events = getattr(uow, "collect_events", None)
+        self._dispatchers = {}  # type: Dict[type, Callable]
 
     def handle(self, message: BaseMessage) -> None:
         """Handle a message.
@@ -122,10 +120,11 @@ class BaseMessageBus(AbstractMessageBus):
             message: Message.
 
         """
-        self.queue = MessageQueue([message])
-        while self.queue:
-            message = self.queue.popleft()
-            self.handle_message(message)
+        queue = self.queue = MessageQueue([message])
+        popleft = queue.popleft
+        handle_message = self.handle_message
+        while queue:
+            handle_message(popleft())
 
     def subscribe(self, message: Type[BaseMessage], handler: Callable) -> None:
         """Subscribe a handler for a `Command` or `Event`.
@@ -149,14 +148,36 @@ class BaseMessageBus(AbstractMessageBus):
         Args:
             message: Message to handle.
 
+        """
+        message_type = type(message)
+        dispatcher = self._dispatchers.get(message_type)
+        if dispatcher is None:
+            dispatcher = self._resolve_dispatcher(message)
+            self._dispatchers[message_type] = dispatcher
+
+        dispatcher(message)
+
+    def _resolve_dispatcher(self, message: BaseMessage) -> Callable:
+        """Resolve method with which to handle message.
+
+        Args:
+            message: Message to handle.
+
+        Returns:
+            Method with which to handle message.
+
+        Raises:
+            TypeError: when message is not a command or an event.
+
         """
         if isinstance(message, BaseCommand):
-            self.handle_command(message)
-        elif isinstance(message, BaseEvent):
-            self.handle_event(message)
-        else:
-            error = f"{message} was not a 'Command' or an 'Event'"
-            raise TypeError(error)
+            return self.handle_command
+
+        if isinstance(message, BaseEvent):
+            return self.handle_event
+
+        error = f"{message} was not a 'Command' or an 'Event'"
+        raise TypeError(error)
 
     def handle_command(self, command: BaseCommand) -> None:
         """Handle command.
@@ -193,6 +214,5 @@ class BaseMessageBus(AbstractMessageBus):
 
     def collect_events(self) -> None:
         """Collect events."""
-        if hasattr(self.uow, "collect_events"):
-            events = list(eventcollector(self.uow))
-            self.queue.extend(events)
+        if self._collect_events is not None:
+            self.queue.extend(self._collect_events())
@@ -22,3 +22,5 @@ __all__ = ["BaseCommand"]
 
 class BaseCommand(BaseMessage):
     """Class implements a command."""
+
+    __slots__ = ()
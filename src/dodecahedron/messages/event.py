@@ -17,3 +17,5 @@ __all__ = ["BaseEvent"]
 
 class BaseEvent(BaseMessage):
     """Class implements an event."""
+
+    __slots__ = ()
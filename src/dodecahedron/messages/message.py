@@ -6,7 +6,7 @@
 # Standard Library Imports
 from __future__ import annotations
 import abc
-import datetime
+import time
 
 __all__ = ["BaseMessage"]
 
@@ -16,26 +16,30 @@ CREATED_AT = "__created_at__"
 
 
 class BaseMessage(abc.ABC):
-    """Class implements a message."""
+    """Class implements a message.
+
+    Messages record the time at which they were created as a count of
+    nanoseconds from a monotonic clock, which is used to order messages.
+
+    """
+
+    __slots__ = (CREATED_AT,)
+    __created_at__: int
 
     def __new__(cls) -> BaseMessage:
         instance = super().__new__(cls)
-        now = datetime.datetime.now()
+        now = time.monotonic_ns()
         setattr(instance, CREATED_AT, now)
         return instance
 
     def __gt__(self, other: object) -> bool:
-        result = (
-            getattr(self, CREATED_AT) > getattr(other, CREATED_AT)
-            if isinstance(other, BaseMessage)
-            else False
-        )
-        return result
+        try:
+            return self.__created_at__ > getattr(other, CREATED_AT)
+        except AttributeError:
+            return NotImplemented
 
     def __lt__(self, other: object) -> bool:
-        result = (
-            getattr(self, CREATED_AT) < getattr(other, CREATED_AT)
-            if isinstance(other, BaseMessage)
-            else False
-        )
-        return result
+        try:
+            return self.__created_at__ < getattr(other, CREATED_AT)
+        except AttributeError:
+            return NotImplemented
@@ -32,17 +32,14 @@ class SingletonMeta(abc.ABCMeta):
 
     """
 
-    __instances__: Dict[str, T] = {}
+    __instances__: Dict[type, Any] = {}
 
     def __call__(cls: Type[T], *args, **kwargs) -> T:
-        key = make_key(cls)
-
-        if key not in SingletonMeta.__instances__:
+        instance = SingletonMeta.__instances__.get(cls)
+        if instance is None:
             instance = super().__call__(*args, **kwargs)
             if SingletonMeta.is_singleton(instance):
-                SingletonMeta.__instances__[key] = instance
-        else:
-            instance = SingletonMeta.__instances__[key]
+                SingletonMeta.__instances__[cls] = instance
 
         return instance
 
@@ -60,9 +57,7 @@ class SingletonMeta(abc.ABCMeta):
 
         """
         subclass = get_class(__subclass)
-        key = make_key(subclass)
-        if SingletonMeta.__instances__.get(key):
-            del SingletonMeta.__instances__[key]
+        SingletonMeta.__instances__.pop(subclass, None)
 
     @staticmethod
     def is_singleton(__obj: Union[object, type], /) -> bool:
@@ -79,20 +74,6 @@ class SingletonMeta(abc.ABCMeta):
         return result
 
 
-def make_key(__cls: type, /) -> str:
-    """Make a unique key for a class.
-
-    Args:
-        __cls: Class for which to make key.
-
-    Returns:
-        Key.
-
-    """
-    result = "%s.%s" % (__cls.__module__, __cls.__name__)
-    return result
-
-
 def get_class(__class_or_object: Any, /) -> type:
     """Get class of object.
 
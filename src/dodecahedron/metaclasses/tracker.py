@@ -3,10 +3,12 @@
 # Standard Library Imports
 import abc
 import functools
+import inspect
 from types import FunctionType
 from types import MethodType
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import Sequence
 from typing import Type
 from typing import TypeVar
@@ -21,6 +23,7 @@ GET_METHOD = "get"
 LIST_METHOD = "list"
 REMOVE_METHOD = "remove"
 SEEN_ATTR = "__seen__"
+TRACKED_METHODS = (ADD_METHOD, GET_METHOD, LIST_METHOD, REMOVE_METHOD)
 
 # Custom types
 T = TypeVar("T")
@@ -30,8 +33,8 @@ class TrackerMeta(abc.ABCMeta):
     """Metaclass for tracking child objects."""
 
     def __new__(meta, name: str, bases, namespace: dict, **kwargs) -> type:
-        wrapped_attrs = meta.wrap_attributes(namespace)
-        return super().__new__(meta, name, bases, wrapped_attrs, **kwargs)
+        meta.wrap_attributes(namespace)
+        return super().__new__(meta, name, bases, namespace, **kwargs)
 
     def __call__(cls: Type[T], *args, **kwargs) -> T:
         instance = super().__call__(*args, **kwargs)
@@ -40,53 +43,39 @@ class TrackerMeta(abc.ABCMeta):
 
     @classmethod
     def wrap_attributes(cls, attrs: dict) -> dict:
-        """Wrap attributes.
+        """Wrap tracked methods in place.
 
-         Args:
+        Args:
             attrs: Attributes to wrap.
 
         Returns:
             Wrapped attributes.
 
         """
-        results = {
-            key: (
-                cls.wrap_method(key, value)
-                if isinstance(value, (FunctionType, MethodType))
-                else value
-            )
-            for key, value in attrs.items()
-        }
-        return results
+        for key in TRACKED_METHODS:
+            value = attrs.get(key)
+            if isinstance(value, FunctionType):
+                attrs[key] = cls.wrap_method(key, value)
+
+        return attrs
 
     @classmethod
     def wrap_method(cls, name: str, method: Any) -> Callable:
         """Wrap method.
 
         Args:
+            name: Name of method.
             method: Method to wrap.
 
         Returns:
             Wrapped method.
 
         """
-        if not isinstance(method, (FunctionType, MethodType)):
-            message = f"expected method, got type {type(method)} instead"
-            raise TypeError(message)
-
-        if name == ADD_METHOD:
-            return track_first_positional_argument(method)
-
-        if name == GET_METHOD:
-            return track_single_return_value(method)
-
-        if name == LIST_METHOD:
-            return track_multiple_return_values(method)
-
-        if name == REMOVE_METHOD:
-            return track_first_positional_argument(method)
+        decorator = TRACKERS.get(name)
+        if decorator is None:
+            return method
 
-        return method
+        return decorator(method)
 
 
 def track_first_positional_argument(method: Callable, /) -> Callable:
@@ -102,9 +91,30 @@ def track_first_positional_argument(method: Callable, /) -> Callable:
         TypeError: when argument is not a method.
 
     """
-    if not isinstance(method, (FunctionType, MethodType)):
-        message = f"expected method, got type {type(method)} instead"
-        raise TypeError(message)
+    raise_for_method(method)
+
+    if accepts_single_argument(method):
+
+        @functools.wraps(method)
+        def unary_wrapper(self, obj: object, /) -> Any:
+            """Wrapper applied to decorated method with a single argument.
+
+            Args:
+                obj: Object to track.
+
+            Returns:
+                Result of called method.
+
+            """
+            result = method(self, obj)
+            try:
+                self.__seen__.add(obj)
+            except (AttributeError, TypeError):
+                add_seen_object(self, obj)
+
+            return result
+
+        return unary_wrapper
 
     @functools.wraps(method)
     def wrapper(self, obj: object, /, *args, **kwargs) -> Any:
@@ -123,10 +133,13 @@ def track_first_positional_argument(method: Callable, /) -> Callable:
 
         # We only add objects to those seen after the method executes
         # successfully. We don't want to track objects that raise exceptions.
-        add_seen_object(self, obj)
+        try:
+            self.__seen__.add(obj)
+        except (AttributeError, TypeError):
+            add_seen_object(self, obj)
+
         return result
 
-    functools.update_wrapper(wrapper, method)
     return wrapper
 
 
@@ -143,9 +156,7 @@ def track_multiple_return_values(method: Callable, /) -> Callable:
         TypeError: when argument is not a method.
 
     """
-    if not isinstance(method, (FunctionType, MethodType)):
-        message = f"expected method, got type {type(method)} instead"
-        raise TypeError(message)
+    raise_for_method(method)
 
     @functools.wraps(method)
     def wrapper(self, *args, **kwargs) -> Sequence:
@@ -161,11 +172,13 @@ def track_multiple_return_values(method: Callable, /) -> Callable:
         """
         results = method(self, *args, **kwargs)
         if results is not None:
-            update_seen_objects(self, results)
+            try:
+                self.__seen__.update(results)
+            except (AttributeError, TypeError):
+                update_seen_objects(self, results)
 
         return results
 
-    functools.update_wrapper(wrapper, method)
     return wrapper
 
 
@@ -182,9 +195,31 @@ def track_single_return_value(method: Callable, /) -> Callable:
         TypeError: when argument is not a method.
 
     """
-    if not isinstance(method, (FunctionType, MethodType)):
-        message = f"expected method, got type {type(method)} instead"
-        raise TypeError(message)
+    raise_for_method(method)
+
+    if accepts_single_argument(method, positional_only=True):
+
+        @functools.wraps(method)
+        def unary_wrapper(self, ref: Any, /) -> Any:
+            """Wrapper applied to decorated method with a single argument.
+
+            Args:
+                ref: Argument to pass to wrapped method.
+
+            Returns:
+                Result of called method.
+
+            """
+            result = method(self, ref)
+            if result is not None:
+                try:
+                    self.__seen__.add(result)
+                except (AttributeError, TypeError):
+                    add_seen_object(self, result)
+
+            return result
+
+        return unary_wrapper
 
     @functools.wraps(method)
     def wrapper(self, *args, **kwargs) -> Any:
@@ -200,14 +235,25 @@ def track_single_return_value(method: Callable, /) -> Callable:
         """
         result = method(self, *args, **kwargs)
         if result is not None:
-            add_seen_object(self, result)
+            try:
+                self.__seen__.add(result)
+            except (AttributeError, TypeError):
+                add_seen_object(self, result)
 
         return result
 
-    functools.update_wrapper(wrapper, method)
     return wrapper
 
 
+# Decorators with which to wrap each tracked method
+TRACKERS = {
+    ADD_METHOD: track_first_positional_argument,
+    GET_METHOD: track_single_return_value,
+    LIST_METHOD: track_multiple_return_values,
+    REMOVE_METHOD: track_first_positional_argument,
+}  # type: Dict[str, Callable[[Callable], Callable]]
+
+
 # ----------------------------------------------------------------------------
 # Helper Functions
 # ----------------------------------------------------------------------------
@@ -220,8 +266,12 @@ def add_seen_object(parent: Any, child: Any) -> None:
 
     """
     try:
-        set_default_attr(parent, SEEN_ATTR, set())
-        seen = getattr(parent, SEEN_ATTR)  # type: set
+        seen = parent.__seen__  # type: set
+    except AttributeError:
+        # Objects not instantiated by `TrackerMeta` may lack the attribute.
+        seen = set_default_attr(parent, SEEN_ATTR, set())
+
+    try:
         seen.add(child)
     except TypeError:
         message = "Tracking decorator does not support unhashable objects"
@@ -237,15 +287,68 @@ def update_seen_objects(parent: Any, children: Sequence) -> None:
 
     """
     try:
-        set_default_attr(parent, SEEN_ATTR, set())
-        seen = getattr(parent, SEEN_ATTR)  # type: set
+        seen = parent.__seen__  # type: set
+    except AttributeError:
+        # Objects not instantiated by `TrackerMeta` may lack the attribute.
+        seen = set_default_attr(parent, SEEN_ATTR, set())
+
+    try:
         seen.update(children)
     except TypeError:
         message = "Tracking decorator does not support unhashable objects"
         warnings.warn(message)
 
 
-def set_default_attr(obj: object, attr: str, value: Any) -> None:
+def accepts_single_argument(
+    method: Callable, /, positional_only: bool = False
+) -> bool:
+    """Check whether method accepts exactly one argument besides `self`.
+
+    Args:
+        method: Method to check.
+        positional_only (optional): Whether the argument must also be
+            positional-only. Default ``False``.
+
+    Returns:
+        Whether method accepts a single argument.
+
+    """
+    try:
+        params = list(inspect.signature(method).parameters.values())
+    except (TypeError, ValueError):
+        return False
+
+    kinds = (
+        (inspect.Parameter.POSITIONAL_ONLY,)
+        if positional_only
+        else (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+    )
+    result = len(params) == 2 and all(
+        param.kind in kinds and param.default is inspect.Parameter.empty
+        for param in params
+    )
+    return result
+
+
+def raise_for_method(__obj: object, /) -> None:
+    """Raise error when object is not a method.
+
+    Args:
+        __obj: Object to check.
+
+    Raises:
+        TypeError: when object is not a method.
+
+    """
+    if not isinstance(__obj, (FunctionType, MethodType)):
+        message = f"expected method, got type {type(__obj)} instead"
+        raise TypeError(message)
+
+
+def set_default_attr(obj: object, attr: str, value: Any) -> Any:
     """Set default value of attribute on object.
 
     Args:
@@ -253,6 +356,15 @@ def set_default_attr(obj: object, attr: str, value: Any) -> None:
         attr: Name of attribute to set.
         value: Value to which to set attribute.
 
+    Returns:
+        Value of attribute.
+
     """
-    if not hasattr(obj, attr):
-        setattr(obj, attr, value)
+    try:
+        return obj.__dict__.setdefault(attr, value)
+    except AttributeError:
+        # Objects using `__slots__` do not have a `__dict__` attribute.
+        if not hasattr(obj, attr):
+            setattr(obj, attr, value)
+
+        return getattr(obj, attr)
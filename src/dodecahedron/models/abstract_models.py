@@ -36,6 +36,8 @@ class AbstractModel(abc.ABC):
 
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def __eq__(self, other: object) -> bool:
         raise NotImplementedError
@@ -58,6 +60,8 @@ class AbstractAggregate(AbstractModel):
 
     """
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def events(self) -> Union[Deque, "MessageQueue"]:
@@ -15,6 +15,8 @@ __all__ = ["File"]
 class File(AbstractModel):
     """Implements a file model."""
 
+    __slots__ = ("_filename", "_content", "_hash")
+
     def __init__(self, name: str, content: Union[bytes, str]) -> None:
         self.name = name
         self.content = content
@@ -26,11 +28,12 @@ class File(AbstractModel):
 
     @name.setter
     def name(self, value: str) -> None:
-        if not isinstance(value, str):
+        if type(value) is not str and not isinstance(value, str):
             message = f"expected type 'str', got {type(value)} instead"
             raise TypeError(message)
 
         self._filename = value
+        self._hash = hash(value)
 
     @property
     def content(self) -> Union[bytes, str]:
@@ -39,7 +42,12 @@ class File(AbstractModel):
 
     @content.setter
     def content(self, value: str) -> None:
-        if not isinstance(value, (bytes, str)):
+        value_type = type(value)
+        if (
+            value_type is not bytes
+            and value_type is not str
+            and not isinstance(value, (bytes, str))
+        ):
             expected = "expected type 'bytes' or 'str'"
             actual = f"got {type(value)} instead"
             message = ", ".join([expected, actual])
@@ -48,12 +56,15 @@ class File(AbstractModel):
         self._content = value
 
     def __eq__(self, other: object) -> bool:
+        if not isinstance(other, File):
+            return NotImplemented
+
         result = (
-            (other.name, other.content) == (self.name, self.content)
-            if isinstance(other, File)
-            else False
+            other._hash == self._hash
+            and other._filename == self._filename
+            and other._content == self._content
         )
         return result
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return self._hash
@@ -1,14 +1,10 @@
 # -*- coding: utf-8 -*-
 
 # Standard Library Imports
-import importlib
+from importlib.util import find_spec
 
 # Local Imports
 from .abstract_progress_bar import *
 
-try:
-    importlib.import_module("tqdm")
-except (ImportError, ModuleNotFoundError):
-    pass
-else:
+if find_spec("tqdm") is not None:
     from .tqdm_progress_bar import *
@@ -15,33 +15,71 @@ __all__ = ["TqdmProgressBar"]
 
 
 class TqdmProgressBar(AbstractProgressBar):
-    """Implements a tqdm progress bar."""
+    """Implements a tqdm progress bar.
+
+    Args:
+        desc (optional): Description of progress bar. Default ``None``.
+        total (optional): Total progress. Default ``None``.
+        leave (optional): Whether progress bar is maintained between
+            iterations. Default ``False``.
+        miniters (optional): Minimum number of iterations between display
+            updates. When not provided, the display is updated roughly a
+            thousand times over the total progress. Default ``None``.
+        mininterval (optional): Minimum number of seconds between display
+            updates. Default ``0.1``.
+        **kwargs (optional): Keyword arguments to pass to tqdm.
+
+    """
 
     def __init__(
         self,
         desc: Optional[str] = None,
         total: Optional[Union[float, int]] = None,
         leave: bool = False,
-        miniters: Union[float, int] = 1,
+        miniters: Optional[Union[float, int]] = None,
+        mininterval: Union[float, int] = 0.1,
         **kwargs,
     ) -> None:
-        self._progress_bar = tqdm(
-            desc=desc,
-            total=total,
-            leave=leave,
-            miniters=miniters,
+        # Unless given, the minimum iterations follow the total as it changes.
+        self._auto_miniters = miniters is None
+        if miniters is None:
+            miniters = get_miniters(total)
+
+        # The tqdm instance probes the terminal and draws the bar when
+        # created, so creating it is deferred until the bar is first used.
+        self._options = {
+            "desc": desc,
+            "total": total,
+            "leave": leave,
+            "miniters": miniters,
+            "mininterval": mininterval,
             **kwargs,
-        )
+        }
+        self._tqdm = None  # type: Optional[tqdm]
+
+    @property
+    def _progress_bar(self) -> tqdm:
+        """Underlying tqdm progress bar."""
+        if self._tqdm is None:
+            self._tqdm = tqdm(**self._options)
+
+        return self._tqdm
 
     @property
     def current(self) -> int:
         """Current progress."""
-        return self._progress_bar.n
+        if self._tqdm is None:
+            return 0
+
+        return self._tqdm.n
 
     @property
     def leave(self) -> bool:
         """Whether progress bar is maintained between iterations."""
-        return self._progress_bar.leave
+        if self._tqdm is None:
+            return self._options["leave"]
+
+        return self._tqdm.leave
 
     @leave.setter
     def leave(self, value: bool) -> None:
@@ -49,12 +87,18 @@ class TqdmProgressBar(AbstractProgressBar):
             message = f"expected type 'bool', got {type(value)} instead"
             raise TypeError(message)
 
-        self._progress_bar.leave = value
+        if self._tqdm is None:
+            self._options["leave"] = value
+        else:
+            self._tqdm.leave = value
 
     @property
     def total(self) -> int:
         """Total progress."""
-        return self._progress_bar.total
+        if self._tqdm is None:
+            return self._options["total"]
+
+        return self._tqdm.total
 
     @total.setter
     def total(self, n: Union[float, int]) -> None:
@@ -64,11 +108,17 @@ class TqdmProgressBar(AbstractProgressBar):
             message = ", ".join([expected, actual])
             raise TypeError(message)
 
-        self._progress_bar.total = n
+        if self._tqdm is None:
+            self._options["total"] = n
+        else:
+            self._tqdm.total = n
+
+        self._update_miniters(n)
 
     def close(self) -> None:
         """Close progress bar."""
-        self._progress_bar.close()
+        if self._tqdm is not None:
+            self._tqdm.close()
 
     def refresh(self) -> None:
         """Refresh progress bar."""
@@ -77,6 +127,24 @@ class TqdmProgressBar(AbstractProgressBar):
     def reset(self, total: Optional[Union[float, int]] = None) -> None:
         """Reset progress bar."""
         self._progress_bar.reset(total)
+        if total is not None:
+            self._update_miniters(total)
+
+    def _update_miniters(self, total: Optional[Union[float, int]]) -> None:
+        """Update minimum iterations between display updates for total.
+
+        Args:
+            total: Total progress.
+
+        """
+        if not self._auto_miniters:
+            return
+
+        miniters = get_miniters(total)
+        if self._tqdm is None:
+            self._options["miniters"] = miniters
+        else:
+            self._tqdm.miniters = miniters
 
     def update(self, n: Union[float, int] = 1) -> None:
         """Update progress bar.
@@ -90,3 +158,20 @@ class TqdmProgressBar(AbstractProgressBar):
     def write(self, message: str) -> None:
         """Write message to progress bar."""
         self._progress_bar.write(message)
+
+
+# ----------------------------------------------------------------------------
+# Helper Functions
+# ----------------------------------------------------------------------------
+def get_miniters(total: Optional[Union[float, int]]) -> int:
+    """Get minimum iterations between display updates.
+
+    Args:
+        total: Total progress.
+
+    Returns:
+        Minimum iterations, updating the display roughly a thousand times.
+
+    """
+    result = max(1, int(total // 1000)) if total else 1
+    return result
@@ -2,10 +2,15 @@
 
 # Standard Library Imports
 import abc
-from dataclasses import asdict
+import dataclasses
+import functools
 import logging
 import json
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+from typing import Type
 
 # Local Imports
 from ..messages import event
@@ -34,7 +39,95 @@ class AbstractPublisher(abc.ABC):
             event: Event to publish on external broker.
 
         """
-        log.info("publishing: channel=%s, event=%s", channel, event)
-        payload = json.dumps(asdict(event))
+        if log.isEnabledFor(logging.INFO):
+            log.info("publishing: channel=%s, event=%s", channel, event)
 
-        getattr(self.connection, "publish")(channel, payload)
+        serialize = get_serializer(type(event))
+        payload = serialize(event)
+
+        self.connection.publish(channel, payload)
+
+
+# ----------------------------------------------------------------------------
+# Helper Functions
+# ----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def get_serializer(__cls: Type[event.BaseEvent], /) -> Callable[..., str]:
+    """Get JSON serializer for an event class.
+
+    Field names are resolved once per class, so publishing an event only
+    reads its top-level fields instead of recursively copying the event with
+    `dataclasses.asdict`. Nested dataclasses are still converted to
+    dictionaries when they are encountered.
+
+    Args:
+        __cls: Event class.
+
+    Returns:
+        Serializer.
+
+    """
+    names = tuple(field.name for field in dataclasses.fields(__cls))
+    read_fields = make_field_reader(names)
+
+    def serialize(__event: event.BaseEvent, /) -> str:
+        """Serialize event as JSON.
+
+        Args:
+            __event: Event to serialize.
+
+        Returns:
+            JSON representation of event.
+
+        """
+        data = read_fields(__event)
+        return json.dumps(data, default=encode_dataclass)
+
+    return serialize
+
+
+def make_field_reader(__names: Tuple[str, ...], /) -> Callable[..., dict]:
+    """Make function which reads fields from an object into a dictionary.
+
+    The function is generated as a single dictionary literal, which avoids
+    looping over field names and calling `getattr` for each field.
+
+    Args:
+        __names: Names of fields.
+
+    Returns:
+        Function which reads fields.
+
+    Raises:
+        ValueError: when a name is not a valid identifier.
+
+    """
+    for name in __names:
+        if not name.isidentifier():
+            raise ValueError(f"{name!r} is not a valid field name")
+
+    items = ", ".join(f"{name!r}: obj.{name}" for name in __names)
+    source = f"def read_fields(obj):\n    return {{{items}}}\n"
+    namespace = {}  # type: Dict[str, Any]
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace["read_fields"]
+
+
+def encode_dataclass(__obj: Any, /) -> dict:
+    """Encode dataclass instance for JSON serialization.
+
+    Args:
+        __obj: Object to encode.
+
+    Returns:
+        Encoded object.
+
+    Raises:
+        TypeError: when object is not a dataclass instance.
+
+    """
+    if not dataclasses.is_dataclass(__obj) or isinstance(__obj, type):
+        message = f"{type(__obj)} is not JSON serializable"
+        raise TypeError(message)
+
+    return dataclasses.asdict(__obj)
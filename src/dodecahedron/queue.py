@@ -10,13 +10,18 @@ This module defines base classes for queues.
 # Standard Library Imports
 from __future__ import annotations
 import abc
-from collections import deque
+import heapq
+import itertools
+from typing import Any
 from typing import Iterable
 from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 # Local Imports
 from .messages import BaseMessage
+from .messages.message import CREATED_AT
 from .helpers import raise_for_instance
 
 __all__ = ["MessageQueue"]
@@ -71,6 +76,10 @@ class AbstractQueue(abc.ABC):
 class BaseQueue(AbstractQueue):
     """Implements a base class for queues.
 
+    Items are kept in a binary heap ordered by their sort key, so appending
+    an item and popping the next item both take logarithmic time. Items with
+    equal sort keys are popped in the order in which they were added.
+
     Args:
         __iterable (optional): Iterable of objects. Default ``None``.
 
@@ -86,7 +95,10 @@ class BaseQueue(AbstractQueue):
         return instance
 
     def __init__(self, __iterable: Optional[Iterable[object]] = None) -> None:
-        self._items = deque(__iterable or [])
+        self._counter = itertools.count()
+        self._items = [
+            self._make_entry(item) for item in __iterable or []
+        ]  # type: List[Tuple[Any, int, object]]
         self.sort()
 
     def __iter__(self) -> Iterator[object]:
@@ -102,7 +114,32 @@ class BaseQueue(AbstractQueue):
         return self.popleft()
 
     def __repr__(self) -> str:
-        return repr(list(self._items))
+        return repr([entry[-1] for entry in sorted(self._items)])
+
+    @staticmethod
+    def sort_key(__item: object, /) -> Any:
+        """Get key by which to sort item.
+
+        Args:
+            __item: Item in queue.
+
+        Returns:
+            Sort key.
+
+        """
+        return __item
+
+    def _make_entry(self, __item: object, /) -> Tuple[Any, int, object]:
+        """Make heap entry for item.
+
+        Args:
+            __item: Item in queue.
+
+        Returns:
+            Heap entry.
+
+        """
+        return (self.sort_key(__item), next(self._counter), __item)
 
     def append(self, __item: object, /) -> None:
         """Append item to queue.
@@ -111,8 +148,7 @@ class BaseQueue(AbstractQueue):
             __item: Item to append to queue.
 
         """
-        self._items.append(__item)
-        self.sort()
+        heapq.heappush(self._items, self._make_entry(__item))
 
     def extend(self, __iterable: Iterable[object], /) -> None:
         """Extend queue.
@@ -121,16 +157,21 @@ class BaseQueue(AbstractQueue):
             __iterable: Items with which to extend queue.
 
         """
-        self._items.extend(__iterable)
-        self.sort()
+        entries = [self._make_entry(item) for item in __iterable]
+        if len(entries) > len(self._items):
+            self._items.extend(entries)
+            self.sort()
+        else:
+            for entry in entries:
+                heapq.heappush(self._items, entry)
 
     def popleft(self) -> object:
         """Pop item from left side of queue."""
-        return self._items.popleft()
+        return heapq.heappop(self._items)[-1]
 
     def sort(self) -> None:
         """Sort queue."""
-        self._items = deque(sorted(self._items))
+        heapq.heapify(self._items)
 
     def clear(self) -> None:
         """Clear queue."""
@@ -158,6 +199,19 @@ class MessageQueue(BaseQueue):
     def __iter__(self) -> Iterator[BaseMessage]:
         return self
 
+    @staticmethod
+    def sort_key(__item: object, /) -> Any:
+        """Get key by which to sort message.
+
+        Args:
+            __item: Message in queue.
+
+        Returns:
+            Time at which message was created.
+
+        """
+        return getattr(__item, CREATED_AT)
+
     def __next__(self) -> BaseMessage:
         return super().__next__()
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 # Standard Library Imports
-import importlib
+from importlib.util import find_spec
 
 # Local Imports
 from .abstract_repository import *
@@ -9,16 +9,8 @@ from .csv_repository import *
 from .directory_repositories import *
 from .eventful_repository import *
 
-try:
-    importlib.import_module("sqlalchemy")
-except (ImportError, ModuleNotFoundError):
-    pass
-else:
+if find_spec("sqlalchemy") is not None:
     from .sqlalchemy_repository import *
 
-try:
-    importlib.import_module("openpyxl")
-except (ImportError, ModuleNotFoundError):
-    pass
-else:
+if find_spec("openpyxl") is not None:
     from .xlsx_repository import *
@@ -11,10 +11,13 @@ Implementation based on 'Architecture Patterns in Python' repository pattern.
 # Standard Library Imports
 import abc
 import csv
+import io
 import logging
 import pathlib
 from typing import Any
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Union
@@ -34,6 +37,7 @@ log = logging.getLogger("dodecahedron")
 
 # Constants
 CSV_EXTENSION = ".csv"
+CSV_EXTENSIONS = (CSV_EXTENSION, CSV_EXTENSION.upper())
 DEFAULT_INDEX = "id"
 
 
@@ -73,60 +77,66 @@ class CsvRepository(AbstractCsvRepository):
         if isinstance(__filepath, str):
             __filepath = pathlib.Path(__filepath)
 
-        if __filepath.suffix.lower() != CSV_EXTENSION:
+        suffix = __filepath.suffix
+        if suffix not in CSV_EXTENSIONS and suffix.lower() != CSV_EXTENSION:
             message = f"{__filepath!s} is not a CSV file"
             raise ValueError(message)
 
         super().__init__(__filepath)
         self._encoding = encoding
         self._index = index
+        self._columns = []  # type: List[str]
         self._objects = {}  # type: Dict[Union[int, str], dict]
 
-        if self._filepath.exists():
+        # Rows handed out to callers may be changed in place, so the
+        # repository is only clean until one is exposed or modified.
+        self._dirty = not self._exists
+
+        if self._exists:
             self._load()
 
     @property
     def columns(self) -> List[str]:
         """Column names."""
-        try:
-            keys = next(iter(self.objects)).keys()
-            results = list(keys)
-        except StopIteration:
-            return []
-
-        return results
+        return list(self._columns)
 
     @property
     def objects(self) -> List[dict]:
         """Objects in repository."""
+        self._dirty = self._dirty or bool(self._objects)
         return list(self._objects.values())
 
     def _load(self) -> None:
         """Load objects from CSV file."""
-        for obj in self._read_contents():
+        for obj in self._iter_contents():
             if obj.get(self._index):
                 key = obj[self._index]
                 self._objects[key] = obj
             else:
                 log.critical("index column is empty: %s", obj)
 
-    def _read_contents(self) -> List[dict]:
-        """Read contents of a CSV file.
+    def _iter_contents(self) -> Iterator[dict]:
+        """Iterate over contents of a CSV file.
 
-        Returns:
-            Contents of CSV file.
+        Yields:
+            Rows of CSV file.
 
         """
         with self._filepath.open(encoding=self._encoding) as file:
-            reader = csv.DictReader(file)
-            results = [row for row in reader]
-
-        if not all(self._index in row for row in results):
-            log.error("index column '%s' not found", self._index)
-            log.debug("available columns: %s", list(results[0].keys()))
-            raise KeyError(self._index)
-
-        return results
+            reader = csv.reader(file)
+            columns = next(reader, [])
+            if columns and self._index not in columns:
+                log.error("index column '%s' not found", self._index)
+                log.debug("available columns: %s", columns)
+                raise KeyError(self._index)
+
+            self._columns = list(columns)
+            width = len(columns)
+            for row in reader:
+                if len(row) == width:
+                    yield dict(zip(columns, row))
+                elif row:
+                    yield make_object(row, columns)
 
     def add(self, obj: Any) -> None:
         """Add object to repository.
@@ -138,6 +148,9 @@ class CsvRepository(AbstractCsvRepository):
         if self.can_add(obj):
             key = obj[self._index]
             self._objects[key] = obj
+            self._dirty = True
+            if not self._columns:
+                self._columns = list(obj.keys())
 
     def can_add(self, obj: Any, /) -> bool:
         """Check whether object can be added to repository.
@@ -164,6 +177,7 @@ class CsvRepository(AbstractCsvRepository):
 
         """
         result = self._objects.get(ref, None)
+        self._dirty = self._dirty or result is not None
         return result
 
     def list(self) -> List[dict]:
@@ -173,6 +187,7 @@ class CsvRepository(AbstractCsvRepository):
             Objects in repository.
 
         """
+        self._dirty = self._dirty or bool(self._objects)
         results = list(self._objects.values())
         return results
 
@@ -185,42 +200,77 @@ class CsvRepository(AbstractCsvRepository):
         """
         key = obj[self._index]
         del self._objects[key]
+        self._dirty = True
 
     def commit(self) -> None:
         """Commit changes to repository."""
-        self._save()
+        if self._dirty:
+            self._save()
+            self._dirty = False
 
     def _save(self) -> None:
         """Save objects to CSV file."""
-        with self._filepath.open("w", encoding=self._encoding) as file:
-            writer = csv.writer(file)
-            writer.writerow(self.columns)
-            for obj in self._objects.values():
-                row = make_row(obj)
-                writer.writerow(row)
+        objects = self._objects.values()
+        raise_for_rows(objects)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.columns)
+        writer.writerows(obj.values() for obj in objects)
+
+        with self._filepath.open(
+            "w", encoding=self._encoding, newline=""
+        ) as file:
+            file.write(buffer.getvalue())
 
     def rollback(self) -> None:
         """Rollback changes to repository."""
+        if not self._dirty:
+            return
+
         self._objects.clear()
         self._load()
+        self._dirty = False
 
 
 # ----------------------------------------------------------------------------
 # Helper Functions
 # ----------------------------------------------------------------------------
-def make_row(obj: object) -> List[Any]:
-    """Make row.
+def raise_for_rows(objs: Iterable[object]) -> None:
+    """Raise an exception if any object cannot be written as a row.
+
+    Args:
+        objs: Objects to write as rows.
+
+    Raises:
+        TypeError: when an object is not a dictionary.
+
+    """
+    for obj in objs:
+        if type(obj) is not dict and not isinstance(obj, dict):
+            message = f"expected type 'dict', got {type(obj)} instead"
+            raise TypeError(message)
+
+
+def make_object(row: List[str], columns: List[str]) -> dict:
+    """Make object from row whose length differs from the header.
+
+    Missing values are set to ``None`` and extra values are collected under
+    the ``None`` key, as with `csv.DictReader`.
 
     Args:
-        obj: Object with which to make row.
+        row: Row from which to make object.
+        columns: Column names to use as keys.
 
     Returns:
-        Row.
+        Object.
 
     """
-    if not isinstance(obj, dict):
-        message = f"expected type 'dict', got {type(obj)} instead"
-        raise TypeError(message)
+    result = dict(zip(columns, row))  # type: Dict[Optional[str], Any]
+    if len(row) > len(columns):
+        result[None] = row[len(columns) :]
+    else:
+        for column in columns[len(row) :]:
+            result[column] = None
 
-    result = list(obj.values())
     return result
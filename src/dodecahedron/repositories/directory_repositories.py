@@ -2,11 +2,19 @@
 
 # Standard Library Imports
 import abc
+import fnmatch
+import functools
+import itertools
+import locale
 import logging
 import os
 import pathlib
+import re
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Pattern
+from typing import Tuple
 from typing import Union
 
 # Local Imports
@@ -75,12 +83,10 @@ class DirectoryBasedRepository(AbstractRepository):
             Whether a matching file exists.
 
         """
-        try:
-            self._find_filepath(reference)
-        except FileNotFoundError:
-            return False
-        else:
-            return True
+        pattern = f"{reference!s}*.*"
+        matches = walk_directory(self.directory, pattern, recursive=True)
+        result = next(matches, None) is not None
+        return result
 
     def add(self, obj: object) -> pathlib.Path:
         """Add file to repository.
@@ -100,9 +106,12 @@ class DirectoryBasedRepository(AbstractRepository):
             raise TypeError(message)
 
         filepath = self._make_filepath(obj.name)
-        if not os.path.exists(filepath):
-            with filepath.open("w") as file:
+        mode = "xb" if isinstance(obj.content, bytes) else "x"
+        try:
+            with filepath.open(mode) as file:
                 file.write(obj.content)
+        except FileExistsError:
+            log.debug("%s already exists", filepath)
 
         return filepath
 
@@ -143,14 +152,10 @@ class DirectoryBasedRepository(AbstractRepository):
 
         """
         try:
-            filepath = next(
-                filepath
-                for filepath in self._search_filepaths(
-                    reference, extension=extension
-                )
-            )
+            filepaths = self._search_filepaths(reference, extension=extension)
+            filepath = filepaths[0]
 
-        except StopIteration as err:
+        except IndexError as err:
             raise FileNotFoundError(
                 f"No file matching {reference!s} found in {self.directory!s}"
             ) from err
@@ -189,7 +194,7 @@ class DirectoryBasedRepository(AbstractRepository):
             },
         )
         filename = f"{reference!s}*.{extension!s}"
-        filepaths = set(self.directory.rglob(filename))
+        filepaths = find_filepaths(self.directory, filename)
 
         log.debug(
             "Found %(files)s containing %(ref)s in %(dir)s",
@@ -216,21 +221,16 @@ class DirectoryBasedRepository(AbstractRepository):
         if filepath is None:
             raise ValueError("filepath cannot be 'None'")
 
-        if not filepath.parent.exists():
-            message = f"{filepath.parent} does not exist"
-            raise FileNotFoundError(message)
-
-        if not filepath.exists():
-            message = f"{filepath.name} does not exist in {filepath.parent}"
-            raise FileNotFoundError(message)
+        with filepath.open("rb") as file:
+            content = file.read()
 
         try:
-            with filepath.open("tr") as file:
-                result = file.read()
-        except:
-            with filepath.open("rb") as file:
-                result = file.read()
+            text = content.decode(locale.getpreferredencoding(False))
+        except UnicodeDecodeError:
+            return content
 
+        # Translate line endings as the file would be in text mode.
+        result = text.replace("\r\n", "\n").replace("\r", "\n")
         return result
 
     def list(self) -> List[File]:
@@ -284,15 +284,26 @@ class DirectoryBasedRepository(AbstractRepository):
             Filenames.
 
         """
-        filepaths = sorted(
-            (
-                self.directory.glob(query)
-                if not recursive
-                else self.directory.rglob(query)
-            ),
-            reverse=reverse,
+        if "/" in query or os.sep in query:
+            filepaths = sorted(
+                (
+                    self.directory.glob(query)
+                    if not recursive
+                    else self.directory.rglob(query)
+                ),
+                reverse=reverse,
+            )
+            return [path.name for path in filepaths]
+
+        # Sort on path components, as paths themselves are compared.
+        matches = sorted(
+            (pathlib.PurePath(root).parts + (name,), name)
+            for root, name in walk_directory(self.directory, query, recursive)
         )
-        results = [path.name for path in filepaths]
+        if reverse:
+            matches.reverse()
+
+        results = [name for _, name in matches]
         return results
 
     def commit(self) -> None:
@@ -300,3 +311,65 @@ class DirectoryBasedRepository(AbstractRepository):
 
     def rollback(self) -> None:
         """Rollback changes to files in repository"""
+
+
+# ----------------------------------------------------------------------------
+# Helper Functions
+# ----------------------------------------------------------------------------
+def find_filepaths(
+    directory: pathlib.Path, pattern: str
+) -> List[pathlib.Path]:
+    """Find filepaths in directory and subdirectories matching pattern.
+
+    Args:
+        directory: Directory to search.
+        pattern: Glob pattern with which to match filenames.
+
+    Returns:
+        Filepaths.
+
+    """
+    results = [
+        pathlib.Path(root, name)
+        for root, name in walk_directory(directory, pattern, recursive=True)
+    ]
+    return results
+
+
+def walk_directory(
+    directory: pathlib.Path, pattern: str, recursive: bool = False
+) -> Iterator[Tuple[str, str]]:
+    """Walk directory yielding entries with names matching pattern.
+
+    Args:
+        directory: Directory to walk.
+        pattern: Glob pattern with which to match names.
+        recursive (optional): Whether to also walk subdirectories.
+
+    Yields:
+        Parent directory and name of each matching entry.
+
+    """
+    match = compile_pattern(pattern).match
+    for root, dirnames, filenames in os.walk(directory):
+        for name in itertools.chain(dirnames, filenames):
+            if match(os.path.normcase(name)):
+                yield root, name
+
+        if not recursive:
+            break
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> Pattern[str]:
+    """Compile glob pattern into regular expression.
+
+    Args:
+        pattern: Glob pattern.
+
+    Returns:
+        Regular expression.
+
+    """
+    result = re.compile(fnmatch.translate(os.path.normcase(pattern)))
+    return result
@@ -10,6 +10,7 @@ Implementation based on 'Architecture Patterns in Python' repository pattern.
 
 # Standard Library Imports
 from collections import deque
+import itertools
 from typing import Deque
 from typing import Generator
 from typing import Iterable
@@ -49,14 +50,13 @@ class EventfulRepository(AbstractRepository):
 
         """
         self._update_events()
-        while self.events:
-            yield self.events.popleft()
+        # Iterating a message queue pops each message in order.
+        yield from self._events
 
     def _update_events(self) -> None:
         """Update events."""
         events = self._get_child_events()
         self.events.extend(events)
-        self.events.sort()
 
     def _get_child_events(self) -> List[BaseEvent]:
         """Get events from child objects.
@@ -82,11 +82,13 @@ def collect_events_from_objects(objs: Iterable) -> List[BaseEvent]:
         Events.
 
     """
-    results = []
-    for obj in objs:
-        events = collect_events_from_object(obj)
-        results.extend(events)
-
+    # Events need not be ordered here, as the message queue orders them by
+    # creation time when they are added.
+    results = list(
+        itertools.chain.from_iterable(
+            collect_events_from_object(obj) for obj in objs
+        )
+    )  # type: List[BaseEvent]
     return results
 
 
@@ -101,12 +103,11 @@ def collect_events_from_object(obj: object) -> List[BaseEvent]:
 
     """
     events = get_events(obj)
+    if not events:
+        return []
 
-    results = []
-    while events:
-        event = events.popleft()  # type: BaseEvent
-        results.append(event)
-
+    results = list(events)  # type: List[BaseEvent]
+    events.clear()
     return results
 
 
@@ -120,17 +121,20 @@ def get_events(obj: object) -> Union[Deque[BaseEvent], MessageQueue]:
         Events.
 
     """
-    result = getattr(obj, "events", MessageQueue())
-    if not is_message_queue(result) and is_iterable(result):
-        return MessageQueue(result)
+    result = getattr(obj, "events", None)
+    if result is None:
+        return MessageQueue()
 
-    if not is_message_queue(result) and not is_iterable(result):
+    if is_message_queue(result):
+        return result
+
+    if not is_iterable(result):
         expected = "expected type 'Deque' or 'MessageQueue'"
         actual = f"got {type(result)} instead"
         message = ", ".join([expected, actual])
         raise TypeError(message)
 
-    return result
+    return MessageQueue(result)
 
 
 # ----------------------------------------------------------------------------
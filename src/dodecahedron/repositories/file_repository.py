@@ -4,7 +4,9 @@
 # Standard Library Imports
 import abc
 import logging
+import os
 import pathlib
+import stat
 from typing import Union
 
 # Local Imports
@@ -40,14 +42,22 @@ class AbstractFileRepository(AbstractRepository):
         if isinstance(__filepath, str):
             __filepath = pathlib.Path(__filepath)
 
-        if not __filepath.parent.exists():
+        # A single stat call answers whether the file exists and whether it
+        # is a directory; the parent is only checked when the file is absent.
+        try:
+            mode = os.stat(__filepath).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            mode = None
+
+        if mode is None and not os.path.exists(__filepath.parent):
             message = f"{__filepath.parent!s} does not exist"
             raise FileNotFoundError(message)
 
-        if __filepath.is_dir():
+        if mode is not None and stat.S_ISDIR(mode):
             message = f"{__filepath!s} is a directory"
             raise IsADirectoryError(message)
 
+        self._exists = mode is not None
         self._filepath = __filepath
         log.debug("Set filepath as %s", self._filepath)
 
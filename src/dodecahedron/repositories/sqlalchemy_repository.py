@@ -2,14 +2,22 @@
 
 # Standard Library Imports
 from typing import Any
+from typing import Dict
+from typing import Iterable
 
 # Third-Party Imports
+from sqlalchemy import create_engine
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
 
 # Local Imports
 from .sessioned_repository import SessionedRepository
 
-__all__ = ["SqlAlchemyRepository"]
+__all__ = [
+    "SqlAlchemyRepository",
+    "make_session_factory",
+]
 
 
 class SqlAlchemyRepository(SessionedRepository):
@@ -39,6 +47,56 @@ class SqlAlchemyRepository(SessionedRepository):
         """Session."""
         return self._session
 
+    def bulk_add(
+        self, mapper: Any, mappings: Iterable[Dict[str, Any]], /
+    ) -> None:
+        """Add rows to a table in a single statement.
+
+        Callers adding many rows should prefer this method to calling ``add``
+        in a loop, batching very large inputs into chunks of around 1000.
+
+        Args:
+            mapper: Mapped class or table into which to insert rows.
+            mappings: Column values for each row.
+
+        """
+        rows = list(mappings)
+        if rows:
+            self.session.execute(insert(mapper), rows)
+
+    def close(self, *args, **kwargs) -> Any:
+        """Close session.
+
+        Args:
+            *args (optional): Positional arguments.
+            **kwargs (optional): Keyword arguments.
+
+        """
+        result = self._session.close(*args, **kwargs)
+        return result
+
+    def commit(self, *args, **kwargs) -> Any:
+        """Commit changes to database.
+
+        Args:
+            *args (optional): Positional arguments.
+            **kwargs (optional): Keyword arguments.
+
+        """
+        result = self._session.commit(*args, **kwargs)
+        return result
+
+    def rollback(self, *args, **kwargs) -> Any:
+        """Rollback changes to database.
+
+        Args:
+            *args (optional): Positional arguments.
+            **kwargs (optional): Keyword arguments.
+
+        """
+        result = self._session.rollback(*args, **kwargs)
+        return result
+
     def execute(self, *args, **kwargs) -> Any:
         """Call the execute method directly on the SQLAlchemy session.
 
@@ -52,3 +110,49 @@ class SqlAlchemyRepository(SessionedRepository):
         """
         result = self.session.execute(*args, **kwargs)
         return result
+
+
+# ----------------------------------------------------------------------------
+# Helper Functions
+# ----------------------------------------------------------------------------
+def make_session_factory(
+    url: str,
+    /,
+    *,
+    pool_size: int = 20,
+    max_overflow: int = 30,
+    pool_recycle: int = 1800,
+    **kwargs,
+) -> sessionmaker:
+    """Make session factory for use with a sessioned unit of work.
+
+    Connections are checked out of the pool last-in first-out, so that a few
+    connections stay warm and overflow connections sit idle long enough to
+    be recycled. Instances are not expired on commit, sparing objects seen
+    by a repository from being reloaded on next access.
+
+    Args:
+        url: Database URL.
+        pool_size (optional): Number of connections to keep in the pool.
+            Default ``20``.
+        max_overflow (optional): Number of connections to allow beyond the
+            pool size. Default ``30``.
+        pool_recycle (optional): Seconds after which to replace connections.
+            Default ``1800``.
+        **kwargs (optional): Keyword arguments for the engine.
+
+    Returns:
+        Session factory.
+
+    """
+    engine = create_engine(
+        url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=True,
+        pool_use_lifo=True,
+        **kwargs,
+    )
+    result = sessionmaker(bind=engine, expire_on_commit=False)
+    return result
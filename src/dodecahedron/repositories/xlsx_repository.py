@@ -3,10 +3,11 @@
 
 # Standard Library Imports
 import abc
-import collections
+import itertools
 import logging
 import pathlib
 from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Union
@@ -27,6 +28,7 @@ log = logging.getLogger("dodecahedron")
 # Constants
 DEFAULT_INDEX = "id"
 XLSX_EXTENSION = ".xlsx"
+XLSX_EXTENSIONS = (XLSX_EXTENSION, XLSX_EXTENSION.upper())
 
 
 class AbstractXlsxRepository(AbstractFileRepository):
@@ -54,6 +56,9 @@ class XlsxRepository(AbstractXlsxRepository):
         __filepath: Path to xlsx file.
         index: Name of column to use as index.
         sheet_name (optional): Name of sheet in workbook. Default ``None``.
+        read_only (optional): Whether to stream an existing workbook when
+            loading it. The workbook is then reloaded for writing when first
+            accessed or committed. Default ``False``.
 
     Attributes:
         filepath: Path to xlsx file.
@@ -69,22 +74,33 @@ class XlsxRepository(AbstractXlsxRepository):
         /,
         index: str = DEFAULT_INDEX,
         sheet_name: Optional[str] = None,
+        read_only: bool = False,
     ) -> None:
         if isinstance(__filepath, str):
             __filepath = pathlib.Path(__filepath)
 
-        if __filepath.suffix.lower() != XLSX_EXTENSION:
+        suffix = __filepath.suffix
+        if suffix not in XLSX_EXTENSIONS and suffix.lower() != XLSX_EXTENSION:
             message = f"{__filepath!s} is not an xlsx file"
             raise ValueError(message)
 
         super().__init__(__filepath)
         self._index = index
-        self._objects = collections.ChainMap()
+        self._read_only = read_only
+        self._sheet_name = sheet_name
+        self._committed = {}  # type: Dict[Any, dict]
+        self._pending = {}  # type: Dict[Any, dict]
 
-        if self._filepath.exists():
+        if self._exists:
             self._workbook = self._load_workbook()
             self._worksheet = self._get_worksheet(sheet_name)
             self._load()
+            if self._read_only:
+                # Read-only workbooks hold the file open until closed, and
+                # cannot be written, so the workbook is reloaded when needed.
+                self._workbook.close()
+                self._workbook = None
+                self._worksheet = None
         else:
             self._workbook = Workbook()
             self._worksheet = self._make_worksheet(sheet_name)
@@ -92,22 +108,24 @@ class XlsxRepository(AbstractXlsxRepository):
     @property
     def columns(self) -> List[str]:
         """Column names."""
-        try:
-            keys = next(iter(self.objects)).keys()
-            results = list(keys)
-        except StopIteration:
-            return []
+        for obj in itertools.chain(
+            self._committed.values(), self._pending.values()
+        ):
+            return list(obj.keys())
 
-        return results
+        return []
 
     @property
     def objects(self) -> List[dict]:
         """Objects in repository."""
-        return list(self._objects.values())
+        return [*self._committed.values(), *self._pending.values()]
 
     @property
     def workbook(self) -> Workbook:
         """Workbook."""
+        if self._workbook is None:
+            self._reload_workbook()
+
         return self._workbook
 
     def _load_workbook(self) -> Workbook:
@@ -117,9 +135,23 @@ class XlsxRepository(AbstractXlsxRepository):
             Workbook.
 
         """
+        if self._read_only:
+            return load_workbook(
+                self._filepath,
+                read_only=True,
+                data_only=True,
+                keep_links=False,
+            )
+
         result = load_workbook(self._filepath)
         return result
 
+    def _reload_workbook(self) -> None:
+        """Reload workbook for writing."""
+        self._read_only = False
+        self._workbook = self._load_workbook()
+        self._worksheet = self._get_worksheet(self._sheet_name)
+
     def _get_worksheet(self, name: Optional[str] = None) -> Worksheet:
         """Get worksheet.
 
@@ -156,12 +188,10 @@ class XlsxRepository(AbstractXlsxRepository):
         for obj in self._read_contents():
             if obj.get(self._index):
                 key = obj[self._index]
-                self._objects[key] = obj
+                self._committed[key] = obj
             else:
                 log.critical("index column is empty: %s", obj)
 
-        self._objects = self._objects.new_child()
-
     def _read_contents(self) -> List[dict]:
         """Read contents of an xlsx file.
 
@@ -169,14 +199,17 @@ class XlsxRepository(AbstractXlsxRepository):
             Contents of xlsx file.
 
         """
-        data = load_rows(self._worksheet)
-        results = make_objects(data[1:], data[0])
+        rows = (r for r in self._worksheet.iter_rows(values_only=True) if r)
+        columns = next(rows, None)
+        if columns is None:
+            return []
 
-        if not all(self._index in row for row in results):
+        if self._index not in columns:
             log.error("index column '%s' not found", self._index)
-            log.debug("available columns: %s", list(results[0].keys()))
+            log.debug("available columns: %s", list(columns))
             raise KeyError(self._index)
 
+        results = [dict(zip(columns, row)) for row in rows]
         return results
 
     def add(self, obj: object) -> None:
@@ -185,10 +218,17 @@ class XlsxRepository(AbstractXlsxRepository):
         Args:
             obj: Object to add to repository.
 
+        Raises:
+            TypeError: when object is not a dictionary.
+
         """
+        if type(obj) is not dict and not isinstance(obj, dict):
+            message = f"expected type 'dict', got {type(obj)} instead"
+            raise TypeError(message)
+
         if self.can_add(obj):
             key = obj[self._index]
-            self._objects[key] = obj
+            self._pending[key] = obj
 
     def can_add(self, obj: object, /) -> bool:
         """Check whether object can be added to repository.
@@ -201,7 +241,7 @@ class XlsxRepository(AbstractXlsxRepository):
 
         """
         key = obj[self._index]
-        result = key not in self._objects
+        result = key not in self._pending and key not in self._committed
         return result
 
     def get(self, ref: Union[int, str]) -> Optional[object]:
@@ -214,7 +254,10 @@ class XlsxRepository(AbstractXlsxRepository):
             Object.
 
         """
-        result = self._objects.get(ref, None)
+        result = self._pending.get(ref)
+        if result is None:
+            result = self._committed.get(ref)
+
         return result
 
     def list(self) -> List[dict]:
@@ -224,7 +267,7 @@ class XlsxRepository(AbstractXlsxRepository):
             Objects in repository.
 
         """
-        results = list(self._objects.values())
+        results = [*self._committed.values(), *self._pending.values()]
         return results
 
     def remove(self, obj: object) -> None:
@@ -235,38 +278,24 @@ class XlsxRepository(AbstractXlsxRepository):
 
         """
         key = obj[self._index]
-        del self._objects[key]
+        del self._pending[key]
 
     def commit(self) -> None:
         """Commit changes to repository."""
+        if self._workbook is None:
+            self._reload_workbook()
+
         self._update_worksheet()
         self._save_file()
 
     def _update_worksheet(self) -> None:
         """Update worksheet."""
-        recent_objects = self._objects.maps[0]
-        for obj in list(recent_objects.values()):
-            row = self._make_row(obj)
-            self._worksheet.append(row)
-
-        self._objects = self._objects.new_child()
-
-    def _make_row(self, obj: object) -> List[Any]:
-        """Make row.
+        append = self._worksheet.append
+        for obj in self._pending.values():
+            append(list(obj.values()))
 
-        Args:
-            obj: Object with which to make row.
-
-        Returns:
-            Row.
-
-        """
-        if not isinstance(obj, dict):
-            message = f"expected type 'dict', got {type(obj)} instead"
-            raise TypeError(message)
-
-        result = list(obj.values())
-        return result
+        self._committed.update(self._pending)
+        self._pending.clear()
 
     def _save_file(self) -> None:
         """Save objects to xlsx file."""
@@ -274,51 +303,4 @@ class XlsxRepository(AbstractXlsxRepository):
 
     def rollback(self) -> None:
         """Rollback changes to repository."""
-        self._objects = self._objects.parents
-
-
-# ----------------------------------------------------------------------------
-# Helper Functions
-# ----------------------------------------------------------------------------
-def load_rows(__worksheet: Worksheet, /) -> List[dict]:
-    """Load rows from workbook.
-
-    Args:
-        __worksheet: Workbook from which to load rows.
-
-    Returns:
-        Rows.
-
-    """
-    results = [r for r in __worksheet.iter_rows(values_only=True) if r]
-    return results
-
-
-def make_objects(__rows: List[list], /, columns: list) -> List[dict]:
-    """Make objects.
-
-    Args:
-        __rows: Rows from which to make objects.
-        columns: Column names to use as keys.
-
-    Returns:
-        Objects.
-
-    """
-    results = [make_object(row, columns) for row in __rows]
-    return results
-
-
-def make_object(__row: list, /, columns: list) -> dict:
-    """Make object.
-
-    Args:
-        __row: Row from which to make object.
-        columns: Column names to use as keys.
-
-    Returns:
-        Object.
-
-    """
-    result = {columns[idx]: value for idx, value in enumerate(__row)}
-    return result
+        self._pending.clear()
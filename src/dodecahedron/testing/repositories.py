@@ -2,6 +2,8 @@
 
 # Standard Library Imports
 from __future__ import annotations
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Set
@@ -17,48 +19,71 @@ __all__ = ["FakeRepository", "FakeEventfulRepository"]
 # Constants
 DEFAULT_KEY = "reference"
 
-# Private Attributes
-CLOSED_ATTR = "_closed"
-COMMITTED_ATTR = "_committed"
-ROLLED_BACK_ATTR = "_rolled_back"
-
 
 class FakeRepository(AbstractRepository):
     """Implements a fake repository."""
 
+    _closed = False
+    _committed = False
+    _rolled_back = False
+
     def __init__(
         self,
         objects: Optional[List[AbstractModel]] = None,
         key: str = DEFAULT_KEY,
     ) -> None:
         super().__init__()
-        self._objects = set(objects or [])  # type: Set[AbstractModel]
         self._key = key
+        self._objects = set()  # type: Set[AbstractModel]
+
+        # Objects are indexed by reference so that `get()` need not usually
+        # scan the set. The index is only a hint: references may change.
+        self._index = {}  # type: Dict[Any, AbstractModel]
+        for obj in objects or []:
+            self._objects.add(obj)
+            self._index_object(obj)
 
     @property
     def closed(self) -> bool:
         """Whether `close()` method was called."""
-        result = getattr(self, CLOSED_ATTR, False)
-        return result
+        return self._closed
 
     @property
     def committed(self) -> bool:
         """Whether `commit()` method was called."""
-        result = getattr(self, COMMITTED_ATTR, False)
-        return result
+        return self._committed
 
     @property
     def rolled_back(self) -> bool:
         """Whether `rollback()` method was called."""
-        result = getattr(self, ROLLED_BACK_ATTR, False)
-        return result
+        return self._rolled_back
 
     def __contains__(self, obj: AbstractModel) -> bool:
+        # Check identity against the index first, which holds even when the
+        # object's hash has changed since it was added.
+        try:
+            if self._index.get(getattr(obj, self._key, None)) is obj:
+                return True
+        except TypeError:
+            pass
         return obj in self._objects
 
     def add(self, obj: AbstractModel) -> None:
         """Add object."""
         self._objects.add(obj)
+        self._index_object(obj)
+
+    def _index_object(self, obj: AbstractModel, /) -> None:
+        """Index object by reference.
+
+        Args:
+            obj: Object to index.
+
+        """
+        try:
+            self._index.setdefault(getattr(obj, self._key, None), obj)
+        except TypeError:
+            pass
 
     def get(self, ref: str) -> Optional[AbstractModel]:
         """Get object.
@@ -67,12 +92,27 @@ class FakeRepository(AbstractRepository):
             ref: Reference to object.
 
         """
+        try:
+            result = self._index.get(ref)
+        except TypeError:
+            result = None
+
+        if result is not None and getattr(result, self._key, None) == ref:
+            return result
+
+        # Fall back to a scan when the index misses or has gone stale.
         results = (
             obj
             for obj in self._objects
             if getattr(obj, self._key, None) == ref
         )
-        return next(results, None)
+        result = next(results, None)
+        if result is not None:
+            try:
+                self._index[ref] = result
+            except TypeError:
+                pass
+        return result
 
     def list(self) -> List[AbstractModel]:
         """List objects."""
@@ -81,18 +121,24 @@ class FakeRepository(AbstractRepository):
     def remove(self, obj: AbstractModel) -> None:
         """Remove object."""
         self._objects.discard(obj)
+        ref = getattr(obj, self._key, None)
+        try:
+            if self._index.get(ref) is obj:
+                del self._index[ref]
+        except TypeError:
+            pass
 
     def commit(self) -> None:
         """Commit changes."""
-        setattr(self, COMMITTED_ATTR, True)
+        self._committed = True
 
     def rollback(self) -> None:
         """Rollback changes."""
-        setattr(self, ROLLED_BACK_ATTR, True)
+        self._rolled_back = True
 
     def close(self) -> None:
         """Close repository."""
-        setattr(self, CLOSED_ATTR, True)
+        self._closed = True
 
 
 class FakeEventfulRepository(FakeRepository, EventfulRepository):
@@ -10,36 +10,34 @@ from ..units_of_work import EventfulUnitOfWork
 __all__ = ["FakeUnitOfWork", "FakeEventfulUnitOfWork"]
 
 
-# Private Attributes
-COMMITTED_ATTR = "_committed"
-ROLLED_BACK_ATTR = "_rolled_back"
-
-
 class FakeUnitOfWork(AbstractUnitOfWork):
     """Implements a fake unit of work."""
 
+    # Defaults are set on the class so that subclasses which do not call
+    # `super().__init__()` still report neither a commit nor a rollback.
+    _committed = False
+    _rolled_back = False
+
     @property
     def committed(self) -> bool:
         """Whether `commit()` method was called."""
-        result = getattr(self, COMMITTED_ATTR, False)
-        return result
+        return self._committed
 
     @property
     def rolled_back(self) -> bool:
         """Whether `rollback()` method was called."""
-        result = getattr(self, ROLLED_BACK_ATTR, False)
-        return result
+        return self._rolled_back
 
     def __enter__(self) -> FakeUnitOfWork:
         return self
 
     def commit(self) -> None:
         """Commit changes."""
-        setattr(self, COMMITTED_ATTR, True)
+        self._committed = True
 
     def rollback(self) -> None:
         """Rollback changes."""
-        setattr(self, ROLLED_BACK_ATTR, True)
+        self._rolled_back = True
 
 
 class FakeEventfulUnitOfWork(FakeUnitOfWork, EventfulUnitOfWork):
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 # Standard Library Imports
-import importlib
+from importlib.util import find_spec
 
 # Local Imports
 from .abstract_unit_of_work import *
@@ -9,9 +9,5 @@ from .base_unit_of_work import *
 from .eventful_unit_of_work import *
 from .sessioned_unit_of_work import *
 
-try:
-    importlib.import_module("tqdm")
-except (ImportError, ModuleNotFoundError):
-    pass
-else:
+if find_spec("tqdm") is not None:
     from .progressive_unit_of_work import *
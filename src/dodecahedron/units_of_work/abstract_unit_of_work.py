@@ -18,7 +18,13 @@ __all__ = ["AbstractUnitOfWork"]
 
 
 class AbstractUnitOfWork(abc.ABC):
-    """Represents an abstract unit of work."""
+    """Represents an abstract unit of work.
+
+    Units of work implement `__enter__` and `__exit__` directly, rather than
+    through `contextlib.contextmanager`, which would create a generator and a
+    helper object every time a unit of work is entered.
+
+    """
 
     @abc.abstractmethod
     def __enter__(self) -> AbstractUnitOfWork:
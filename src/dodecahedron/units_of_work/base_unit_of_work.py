@@ -12,10 +12,6 @@ from .abstract_unit_of_work import AbstractUnitOfWork
 __all__ = ["BaseUnitOfWork"]
 
 
-# Constants
-AUTO_COMMIT_ATTR = "_auto_commit"
-
-
 class BaseUnitOfWork(AbstractUnitOfWork):
     """Implements a base class for units of work to inherit.
 
@@ -24,11 +20,14 @@ class BaseUnitOfWork(AbstractUnitOfWork):
 
     """
 
+    # Set on the class so that subclasses need not call `super().__init__()`.
+    _auto_commit = False
+
     def __enter__(self) -> BaseUnitOfWork:
         return self
 
     def __exit__(self, exc: Optional[Type[Exception]], *_) -> None:
-        if self.auto_commit is True and not exc:
+        if self._auto_commit is True and not exc:
             self.commit()
 
     @property
@@ -39,8 +38,7 @@ class BaseUnitOfWork(AbstractUnitOfWork):
             TypeError: when value is not type 'bool'.
 
         """
-        result = getattr(self, AUTO_COMMIT_ATTR, False)
-        return result
+        return self._auto_commit
 
     @auto_commit.setter
     def auto_commit(self, value: bool) -> None:
@@ -48,7 +46,7 @@ class BaseUnitOfWork(AbstractUnitOfWork):
             message = f"expected type 'bool', got {type(value)} instead"
             raise TypeError(message)
 
-        setattr(self, AUTO_COMMIT_ATTR, value)
+        self._auto_commit = value
 
     def commit(self) -> None:
         """Commit changes."""
@@ -44,5 +44,5 @@ class EventfulUnitOfWork(BaseUnitOfWork):
             Event.
 
         """
-        while self.events:
-            yield self.events.popleft()
+        # Iterating a message queue pops each message in order.
+        yield from self._events
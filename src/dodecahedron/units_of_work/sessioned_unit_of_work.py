@@ -10,6 +10,7 @@ Based on 'Architecture Patterns in Python' unit-of-work pattern.
 
 # Standard Library Imports
 from __future__ import annotations
+from typing import Any
 from typing import Callable
 from typing import Optional
 from typing import TypeVar
@@ -21,9 +22,6 @@ from .base_unit_of_work import BaseUnitOfWork
 # Custom types
 T = TypeVar("T")
 
-# Private attributes
-SESSION_ATTR = "_session"
-
 
 class SessionedUnitOfWork(BaseUnitOfWork):
     """Class implements a sessioned unit of work.
@@ -38,6 +36,8 @@ class SessionedUnitOfWork(BaseUnitOfWork):
 
     """
 
+    _session = None  # type: Optional[Any]
+
     def __init__(
         self, *args, session_factory: Callable[..., T], **kwargs
     ) -> None:
@@ -47,10 +47,10 @@ class SessionedUnitOfWork(BaseUnitOfWork):
     @property
     def session(self) -> Optional[T]:
         """Session."""
-        return getattr(self, SESSION_ATTR, None)
+        return self._session
 
     def __enter__(self) -> SessionedUnitOfWork:
-        setattr(self, SESSION_ATTR, self._session_factory())
+        self._session = self._session_factory()
         super().__enter__()
         return self
 
@@ -60,20 +60,20 @@ class SessionedUnitOfWork(BaseUnitOfWork):
 
     def close(self) -> None:
         """Close session."""
-        method = getattr(self.session, "close", None)
-        if method is not None:
-            method()
+        session = self.session
+        if session is not None:
+            session.close()
 
     def commit(self) -> None:
         """Commit changes to repository."""
         super().commit()
-        method = getattr(self.session, "commit", None)
-        if method is not None:
-            method()
+        session = self.session
+        if session is not None:
+            session.commit()
 
     def rollback(self) -> None:
         """Rollback changes to repository."""
         super().rollback()
-        method = getattr(self.session, "rollback", None)
-        if method is not None:
-            method()
+        session = self.session
+        if session is not None:
+            session.rollback()
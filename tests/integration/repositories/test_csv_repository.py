@@ -36,3 +36,33 @@ def test_loads_a_csv_file(make_csv_file: Callable[..., pathlib.Path]) -> None:
 
     expected = [{"id": "1", "value": "TEST"}]
     assert result == expected
+
+
+def test_reloads_saved_rows(tempdir: str) -> None:
+    filepath = pathlib.Path(tempdir) / "test.csv"
+    repo = CsvRepository(filepath)
+
+    objs = [{"id": "1", "value": "A"}, {"id": "2", "value": "B,C"}]
+    for obj in objs:
+        repo.add(obj)
+
+    repo.commit()
+    result = CsvRepository(filepath).objects
+
+    assert result == objs
+
+
+def test_rollback_reverts_changes_to_retrieved_rows(
+    make_csv_file: Callable[..., pathlib.Path]
+) -> None:
+    rows = [["id", "value"], ["1", "TEST"]]
+    filepath = make_csv_file("test.csv", rows)
+
+    repo = CsvRepository(filepath)
+    obj = repo.get("1")
+    obj["value"] = "CHANGED"
+    repo.rollback()
+    result = repo.get("1")
+
+    expected = {"id": "1", "value": "TEST"}
+    assert result == expected
@@ -61,3 +61,44 @@ def test_returns_a_list_of_filenames(
         filepath2.name,
         filepath3.name,
     ]
+
+
+def test_retrieves_a_file_in_a_subdirectory(tempdir: str) -> None:
+    subdir = pathlib.Path(tempdir) / "nested"
+    subdir.mkdir()
+    (subdir / "test.txt").write_text("success")
+    repo = DirectoryBasedRepository(tempdir)
+    result = repo.get("test")
+
+    expected = File("test.txt", "success")
+    assert result == expected
+
+
+def test_retrieves_a_binary_file(tempdir: str) -> None:
+    content = b"\x89PNG\r\n\x1a\n\xff"
+    (pathlib.Path(tempdir) / "test.png").write_bytes(content)
+    repo = DirectoryBasedRepository(tempdir)
+    result = repo.get("test")
+
+    expected = File("test.png", content)
+    assert result == expected
+
+
+def test_checks_whether_a_file_exists(
+    make_text_file: Callable[..., pathlib.Path]
+) -> None:
+    filepath = make_text_file("test.txt", "success")
+    repo = DirectoryBasedRepository(filepath.parent)
+
+    assert "test" in repo
+    assert "sample" not in repo
+
+
+def test_does_not_overwrite_an_existing_file(
+    make_text_file: Callable[..., pathlib.Path]
+) -> None:
+    filepath = make_text_file("test.txt", "original")
+    repo = DirectoryBasedRepository(filepath.parent)
+    repo.add(File("test.txt", "replacement"))
+
+    assert filepath.read_text() == "original"
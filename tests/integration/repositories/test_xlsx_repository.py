@@ -77,3 +77,48 @@ def test_adding_rows_is_idempotent(
     worksheet = workbook.active
     result = worksheet["B3"].value
     assert result == "SUCCESS"
+
+
+def test_rollback_discards_only_uncommitted_rows(
+    make_xlsx_file: Callable[..., pathlib.Path]
+) -> None:
+    rows = [["id", "value"], ["1", "TEST"]]
+    filepath = make_xlsx_file("test.xlsx", rows)
+
+    repo = XlsxRepository(filepath)
+    repo.add({"id": "2", "value": "PENDING"})
+    repo.rollback()
+    repo.rollback()
+
+    assert repo.get("2") is None
+    assert repo.get("1") == {"id": "1", "value": "TEST"}
+
+
+def test_adds_row_to_xlsx_file_loaded_read_only(
+    make_xlsx_file: Callable[..., pathlib.Path]
+) -> None:
+    rows = [["id", "value"], ["1", "TEST"]]
+    filepath = make_xlsx_file("test.xlsx", rows)
+
+    repo = XlsxRepository(filepath, read_only=True)
+    assert repo.get("1") == {"id": "1", "value": "TEST"}
+
+    repo.add({"id": "2", "value": "SUCCESS"})
+    repo.commit()
+
+    workbook = load_workbook(filepath, data_only=True, read_only=True)
+    worksheet = workbook.active
+    result = worksheet["B3"].value
+    assert result == "SUCCESS"
+
+
+def test_workbook_is_readable_when_loaded_read_only(
+    make_xlsx_file: Callable[..., pathlib.Path]
+) -> None:
+    rows = [["id", "value"], ["1", "TEST"]]
+    filepath = make_xlsx_file("test.xlsx", rows)
+
+    repo = XlsxRepository(filepath, read_only=True)
+    result = repo.workbook.active["B2"].value
+
+    assert result == "TEST"
@@ -62,3 +62,13 @@ def test_includes_removed_object_in_seen_attribute() -> None:
     tracker = SampleTracker(["success"])
     tracker.remove("success")
     assert "success" in tracker.seen
+
+
+def test_includes_object_added_with_extra_arguments_in_seen() -> None:
+    class ExtendedTracker(SampleTracker):
+        def add(self, obj: Any, *_, **__) -> None:
+            self._objects.add(obj)
+
+    tracker = ExtendedTracker()
+    tracker.add("success", "ignored", flag=True)
+    assert "success" in tracker.seen
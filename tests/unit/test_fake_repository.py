@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+# pylint: disable=missing-function-docstring
+
+# Local Imports
+from dodecahedron.testing import FakeRepository
+
+
+class Model:
+    def __init__(self, reference: str, value: int) -> None:
+        self.reference = reference
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Model) and other.value == self.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+
+def test_keeps_objects_sharing_a_reference() -> None:
+    first, second = Model("a", 1), Model("a", 2)
+    repo = FakeRepository([first, second])
+
+    assert sorted(obj.value for obj in repo.list()) == [1, 2]
+    assert repo.get("a") in (first, second)
+
+
+def test_removing_an_unequal_object_keeps_stored_object() -> None:
+    first, second = Model("a", 1), Model("a", 2)
+    repo = FakeRepository([first])
+    repo.remove(second)
+
+    assert repo.list() == [first]
+    assert repo.get("a") is first
+
+
+def test_gets_remaining_object_after_removing_one_sharing_reference() -> None:
+    first, second = Model("a", 1), Model("a", 2)
+    repo = FakeRepository([first, second])
+    repo.remove(repo.get("a"))
+
+    assert len(repo.list()) == 1
+    assert repo.get("a") is repo.list()[0]
+
+
+def test_gets_object_by_reference_changed_after_adding() -> None:
+    obj = Model("a", 1)
+    repo = FakeRepository([obj])
+    obj.reference = "b"
+
+    assert repo.get("b") is obj
+    assert repo.get("a") is None
+
+
+def test_contains_object_whose_hash_changed_after_adding() -> None:
+    obj = Model("a", 1)
+    repo = FakeRepository([obj])
+    obj.value = 2
+
+    assert obj in repo
+    assert Model("a", 2) not in repo
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# pylint: disable=missing-function-docstring
+
+# Standard Library Imports
+from unittest import mock
+
+# Local Imports
+from dodecahedron.helpers import inject_dependencies
+from dodecahedron.messages import BaseCommand
+
+
+def test_injects_dependencies_into_handler() -> None:
+    uow = mock.Mock()
+
+    def handler(command: BaseCommand, uow: object) -> object:
+        return command, uow
+
+    command = BaseCommand()
+    injected = inject_dependencies(handler, {"uow": uow, "other": None})
+    assert injected(command) == (command, uow)
+
+
+def test_returns_handler_when_no_dependencies_required() -> None:
+    def handler(command: BaseCommand) -> BaseCommand:
+        return command
+
+    result = inject_dependencies(handler, {"uow": mock.Mock()})
+    assert result is handler
+
+
+def test_reinjecting_an_injected_handler_leaves_it_unchanged() -> None:
+    uow = mock.Mock()
+
+    def handler(command: BaseCommand, uow: object) -> object:
+        return command, uow
+
+    command = BaseCommand()
+    injected = inject_dependencies(handler, {"uow": uow})
+    result = inject_dependencies(injected, {"uow": mock.Mock()})
+    assert result(command) == (command, uow)
+
+
+def test_passes_additional_arguments_through_to_handler() -> None:
+    uow = mock.Mock()
+
+    def handler(command: BaseCommand, uow: object, retries: int = 0) -> object:
+        return command, uow, retries
+
+    command = BaseCommand()
+    injected = inject_dependencies(handler, {"uow": uow})
+    assert injected(command, retries=3) == (command, uow, 3)
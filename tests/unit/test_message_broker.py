@@ -30,3 +30,9 @@ def test_message_broker_maintains_subscribers() -> None:
     broker2 = BaseMessageBroker()
     results = broker2.subscribers["test"]
     assert subscriber in results
+
+
+def test_publishing_does_not_create_channel() -> None:
+    broker = BaseMessageBroker()
+    broker.publish("unsubscribed", "{}")
+    assert "unsubscribed" not in broker.channels
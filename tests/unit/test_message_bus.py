@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# pylint: disable=missing-function-docstring
+
+# Standard Library Imports
+from collections import defaultdict
+from unittest import mock
+
+# Third-Party Imports
+import pytest
+
+# Local Imports
+from dodecahedron.messagebus import BaseMessageBus
+from dodecahedron.messages import BaseCommand
+from dodecahedron.messages import BaseEvent
+from dodecahedron.messages import BaseMessage
+from dodecahedron.testing import FakeEventfulUnitOfWork
+
+
+def test_handles_command() -> None:
+    handler = mock.Mock()
+    bus = BaseMessageBus(FakeEventfulUnitOfWork(), {BaseCommand: handler}, {})
+
+    command = BaseCommand()
+    bus.handle(command)
+    handler.assert_called_once_with(command)
+
+
+def test_handles_event_with_each_handler() -> None:
+    handler1, handler2 = mock.Mock(), mock.Mock()
+    event_handlers = defaultdict(list, {BaseEvent: [handler1, handler2]})
+    bus = BaseMessageBus(FakeEventfulUnitOfWork(), {}, event_handlers)
+
+    event = BaseEvent()
+    bus.handle(event)
+    handler1.assert_called_once_with(event)
+    handler2.assert_called_once_with(event)
+
+
+def test_handles_events_collected_from_unit_of_work() -> None:
+    uow = FakeEventfulUnitOfWork()
+    event = BaseEvent()
+    event_handler = mock.Mock()
+
+    def command_handler(_: BaseCommand) -> None:
+        uow.events.append(event)
+
+    bus = BaseMessageBus(
+        uow, {BaseCommand: command_handler}, {BaseEvent: [event_handler]}
+    )
+    bus.handle(BaseCommand())
+    event_handler.assert_called_once_with(event)
+
+
+def test_raises_error_when_message_not_command_or_event() -> None:
+    bus = BaseMessageBus(FakeEventfulUnitOfWork(), {}, {})
+
+    with pytest.raises(TypeError):
+        bus.handle(BaseMessage())
+
+
+def test_handles_command_with_newly_subscribed_handler() -> None:
+    handler1, handler2 = mock.Mock(), mock.Mock()
+    bus = BaseMessageBus(FakeEventfulUnitOfWork(), {BaseCommand: handler1}, {})
+    bus.handle(BaseCommand())
+
+    bus.subscribe(BaseCommand, handler2)
+    command = BaseCommand()
+    bus.handle(command)
+    handler2.assert_called_once_with(command)
+
+
+def test_handles_messages_with_handlers_replaced_after_dispatch() -> None:
+    handler1, handler2 = mock.Mock(), mock.Mock()
+    bus = BaseMessageBus(
+        FakeEventfulUnitOfWork(),
+        {BaseCommand: handler1},
+        {BaseEvent: [handler1]},
+    )
+    bus.handle(BaseCommand())
+    bus.handle(BaseEvent())
+
+    bus.command_handlers[BaseCommand] = handler2
+    bus.event_handlers = {BaseEvent: [handler2]}
+    command, event = BaseCommand(), BaseEvent()
+    bus.handle(command)
+    bus.handle(event)
+    assert handler2.call_args_list == [mock.call(command), mock.call(event)]
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+# pylint: disable=import-error
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+
+# Third-Party Imports
+import pytest
+
+# Local Imports
+from dodecahedron.progress import TqdmProgressBar
+
+
+def test_unused_progress_bar_writes_nothing(
+    capsys: pytest.CaptureFixture,
+) -> None:
+    progress_bar = TqdmProgressBar(desc="test", total=10)
+    progress_bar.close()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+
+
+def test_progress_bar_tracks_updates() -> None:
+    progress_bar = TqdmProgressBar(desc="test", total=10)
+    progress_bar.update(3)
+
+    assert progress_bar.current == 3
+    progress_bar.close()
+
+
+def test_reset_recomputes_update_frequency() -> None:
+    progress_bar = TqdmProgressBar(desc="test", total=100000)
+    progress_bar.update()
+    progress_bar.reset(total=10)
+
+    assert progress_bar._progress_bar.miniters == 1
+    progress_bar.close()
+
+
+def test_total_recomputes_update_frequency_before_first_use() -> None:
+    progress_bar = TqdmProgressBar(desc="test", total=10)
+    progress_bar.total = 100000
+    progress_bar.update()
+
+    assert progress_bar._progress_bar.miniters == 100
+    progress_bar.close()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+# Standard Library Imports
+import dataclasses
+import json
+from unittest import mock
+
+# Local Imports
+from dodecahedron.messages import BaseEvent
+from dodecahedron.publishers import AbstractPublisher
+
+
+@dataclasses.dataclass
+class ExampleValue:
+    value: int = 1
+
+
+@dataclasses.dataclass
+class ExampleEvent(BaseEvent):
+    ref: str = "test"
+    values: list = dataclasses.field(default_factory=lambda: [ExampleValue()])
+
+
+class ExamplePublisher(AbstractPublisher):
+    def __init__(self) -> None:
+        self._connection = mock.Mock()
+
+    @property
+    def connection(self) -> mock.Mock:
+        return self._connection
+
+
+def test_publishes_event_as_json() -> None:
+    publisher = ExamplePublisher()
+    publisher.publish("test", ExampleEvent())
+
+    channel, payload = publisher.connection.publish.call_args.args
+    assert channel == "test"
+    assert json.loads(payload) == {"ref": "test", "values": [{"value": 1}]}
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# pylint: disable=import-error
+# pylint: disable=missing-function-docstring
+
+# Standard Library Imports
+import pathlib
+from typing import Any
+from typing import Generator
+from typing import List
+from typing import Optional
+
+# Third-Party Imports
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+# pylint: disable=wrong-import-position
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+# Local Imports
+from dodecahedron.repositories import SqlAlchemyRepository
+from dodecahedron.repositories import make_session_factory
+
+metadata = MetaData()
+items = Table(
+    "items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("value", String),
+)
+
+
+class ItemRepository(SqlAlchemyRepository):
+    def add(self, obj: Any) -> None:
+        self.bulk_add(items, [obj])
+
+    def get(self, ref: Any) -> Optional[Any]:
+        query = select(items).where(items.c.id == ref)
+        return self.session.execute(query).first()
+
+    def list(self) -> List[Any]:
+        return list(self.session.execute(select(items)))
+
+    def remove(self, obj: Any) -> None:
+        self.session.execute(items.delete().where(items.c.id == obj.id))
+
+
+@pytest.fixture
+def session() -> Generator[Session, None, None]:
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def test_adds_rows_in_bulk(session: Session) -> None:
+    repo = ItemRepository(session)
+    repo.bulk_add(items, ({"id": i, "value": str(i)} for i in range(3)))
+    repo.commit()
+
+    result = [(row.id, row.value) for row in repo.list()]
+    assert result == [(0, "0"), (1, "1"), (2, "2")]
+
+
+def test_adds_nothing_in_bulk_when_no_rows(session: Session) -> None:
+    repo = ItemRepository(session)
+    repo.bulk_add(items, [])
+
+    assert repo.list() == []
+
+
+def test_makes_session_factory(tmp_path: pathlib.Path) -> None:
+    factory = make_session_factory(
+        f"sqlite:///{tmp_path / 'test.db'}", pool_size=2, max_overflow=1
+    )
+    metadata.create_all(factory.kw["bind"])
+
+    with factory() as session:
+        repo = ItemRepository(session)
+        repo.add({"id": 1, "value": "TEST"})
+        repo.commit()
+        result = repo.get(1)
+
+    assert result.value == "TEST"
+    assert session.bind.pool.size() == 2
+    assert factory.kw["expire_on_commit"] is False